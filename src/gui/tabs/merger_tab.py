@@ -1,13 +1,13 @@
 from PyQt5 import QtCore
 from PyQt5.QtCore import Qt
-from PyQt5.QtWidgets import QWidget, QLabel, QPushButton, QVBoxLayout, QSizePolicy, QCheckBox, QErrorMessage
+from PyQt5.QtWidgets import QWidget, QLabel, QPushButton, QVBoxLayout, QSizePolicy, QCheckBox, QMessageBox
 
 from src.gui.widgets.file_selector_widget import FileSelector
 import src.utils.graphics_utils as graphic_util
 
 
 class MergeTab(QWidget):
-    signal_merge_point_clouds = QtCore.pyqtSignal(bool, str, str, str)
+    signal_merge_point_clouds = QtCore.pyqtSignal(bool, bool, str, str, str)
 
     def __init__(self, merge_path="", input_path=""):
         super().__init__()
@@ -36,6 +36,19 @@ class MergeTab(QWidget):
         )
         self.input_checkbox.stateChanged.connect(self.checkbox_changed)
 
+        self.reload_checkbox = QCheckBox()
+        self.reload_checkbox.setText("Reload point clouds from disk")
+        self.reload_checkbox.setStyleSheet(
+            "QCheckBox::indicator {"
+            f"    width: {int(graphic_util.SIZE_SCALE_X * 20)}px;"
+            f"    height: {int(graphic_util.SIZE_SCALE_Y * 20)}px;"
+            "}"
+            "QCheckBox::indicator::text {"
+            f"    padding-left: {int(graphic_util.SIZE_SCALE_X * 10)}px;"
+            "}"
+        )
+        self.reload_checkbox.setEnabled(False)
+
         self.fs_input1 = FileSelector(text="First point cloud:", base_path=input_path)
         self.fs_input2 = FileSelector(text="Second point cloud:", base_path=input_path)
         self.fs_input1.setEnabled(False)
@@ -46,6 +59,7 @@ class MergeTab(QWidget):
         widget_input.setLayout(layout_input)
         layout_input.addWidget(self.fs_input1)
         layout_input.addWidget(self.fs_input2)
+        layout_input.addWidget(self.reload_checkbox)
 
         self.fs_merge = FileSelector(text="Save path:", base_path=merge_path, label_width=70)
         bt_merge = QPushButton("Merge point clouds")
@@ -65,9 +79,12 @@ class MergeTab(QWidget):
     def checkbox_changed(self, state):
         self.fs_input1.setEnabled(state)
         self.fs_input2.setEnabled(state)
+        self.reload_checkbox.setEnabled(state)
         if state:
             return
 
+        self.reload_checkbox.setChecked(False)
+
         self.fs_input1.inputField.setText("")
         self.fs_input1.file_path = ""
 
@@ -76,14 +93,12 @@ class MergeTab(QWidget):
 
     def merge_point_clouds(self):
         if not self.fs_merge.file_path:
-            dialog = QErrorMessage(self)
-            dialog.setModal(True)
-            dialog.setWindowTitle("Error")
-            dialog.showMessage("Please select location to save the merged point cloud!")
+            QMessageBox.critical(self, "Error", "Please select location to save the merged point cloud!")
             return
 
         is_checked = self.input_checkbox.isChecked()
+        reload_inputs = self.reload_checkbox.isChecked()
         pc_path1 = self.fs_input1.file_path
         pc_path2 = self.fs_input2.file_path
         merge_path = self.fs_merge.file_path
-        self.signal_merge_point_clouds.emit(is_checked, pc_path1, pc_path2, merge_path)
+        self.signal_merge_point_clouds.emit(is_checked, reload_inputs, pc_path1, pc_path2, merge_path)
@@ -66,6 +66,11 @@ class VisualizerTab(QWidget):
         self.debug_color_dialog_second = ColorPicker("Secondary debug color: ")
         self.debug_color_dialog_second.setEnabled(False)
 
+        # Debug colors converted once whenever they change, instead of on every transformation update
+        self.debug_colors = self.convert_debug_colors()
+        self.debug_color_dialog_first.color_changed.connect(self.update_debug_colors)
+        self.debug_color_dialog_second.color_changed.connect(self.update_debug_colors)
+
         self.zoom_widget = SimpleInputField("Zoom: ", "1.0", 50, 60, validator=double_validator)
 
         button_apply = QPushButton()
@@ -102,8 +107,7 @@ class VisualizerTab(QWidget):
 
     def apply_to_vis(self):
         use_debug_color = self.debug_color_checkbox.isChecked()
-        self.signal_change_vis.emit(use_debug_color, np.asarray(self.debug_color_dialog_first.color_debug),
-                                    np.asarray(self.debug_color_dialog_second.color_debug),
+        self.signal_change_vis.emit(use_debug_color, self.debug_colors[0], self.debug_colors[1],
                                     float(self.zoom_widget.lineedit.text()),
                                     self.front_widget.values, self.lookat_widget.values, self.up_widget.values)
 
@@ -121,8 +125,15 @@ class VisualizerTab(QWidget):
         return self.debug_color_checkbox.isChecked()
 
     def get_debug_colors(self):
-        return np.asarray(self.debug_color_dialog_first.color_debug), np.asarray(
-            self.debug_color_dialog_second.color_debug)
+        return self.debug_colors
+
+    def update_debug_colors(self):
+        self.debug_colors = self.convert_debug_colors()
+
+    def convert_debug_colors(self):
+        # Open3D clips uniform colors to the [0, 1] range, the same is done here
+        return (np.clip(np.asarray(self.debug_color_dialog_first.color_debug, dtype=np.float32), 0, 1),
+                np.clip(np.asarray(self.debug_color_dialog_second.color_debug, dtype=np.float32), 0, 1))
 
     def get_current_transformations(self):
         return (float(
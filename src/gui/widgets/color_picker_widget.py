@@ -1,10 +1,13 @@
 import numpy as np
+from PyQt5 import QtCore
 from PyQt5.QtWidgets import QWidget, QHBoxLayout, QLabel, QPushButton, QColorDialog, QLineEdit
 import src.utils.graphics_utils as graphic_util
 
 
 
 class ColorPicker(QWidget):
+    color_changed = QtCore.pyqtSignal()
+
     def __init__(self, label_text="", default_color=np.ones(3, dtype=int)*255):
         super().__init__()
         self.color_debug = default_color
@@ -43,3 +46,4 @@ class ColorPicker(QWidget):
         if color.isValid():
             self.color_box.setStyleSheet(f"background-color: {color.name()};")
             self.color_debug = color.getRgbF()[0:3]
+            self.color_changed.emit()
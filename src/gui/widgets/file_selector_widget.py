@@ -20,9 +20,8 @@ class FileSelector(QWidget):
         icon = self.style().standardIcon(QStyle.SP_DialogOpenButton)
         button.setIcon(icon)
 
+        # The directory is only checked once the file dialog is opened
         self.base_path = base_path
-        if not base_path or not os.path.isdir(base_path):
-            self.base_path = None
 
         layout.addWidget(label)
         layout.addWidget(self.inputField)
@@ -43,7 +42,7 @@ class FileSelector(QWidget):
         if self.type is not QFileDialog.Directory:
             dialog.setNameFilter(self.name_filter)
 
-        if self.base_path:
+        if self.base_path and os.path.isdir(self.base_path):
             dialog.setDirectory(self.base_path)
 
         dialog.setViewMode(QFileDialog.Detail)
@@ -0,0 +1,40 @@
+from PyQt5.QtCore import QSignalBlocker
+from PyQt5.QtWidgets import QTabWidget, QWidget
+
+
+class LazyTabWidget(QTabWidget):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+
+        # Maps the index of each placeholder tab to the function that creates the real tab
+        self.factories = {}
+        self.currentChanged.connect(self.create_tab)
+
+    def add_lazy_tab(self, factory, title):
+        with QSignalBlocker(self):
+            index = self.addTab(QWidget(), title)
+
+        self.factories[index] = factory
+        if index == self.currentIndex():
+            self.create_tab(index)
+
+        return index
+
+    def create_tab(self, index):
+        factory = self.factories.get(index)
+        if factory is None:
+            return
+
+        # The factory is only dropped once the tab was built, so a failed creation is retried on the next activation
+        widget = factory()
+        del self.factories[index]
+        placeholder = self.widget(index)
+        title = self.tabText(index)
+
+        # Replacing the placeholder would change the current tab, which must not trigger another creation
+        with QSignalBlocker(self):
+            self.removeTab(index)
+            self.insertTab(index, widget, title)
+            self.setCurrentIndex(index)
+
+        placeholder.deleteLater()
@@ -121,9 +121,10 @@ class Transformation3DPicker(QWidget):
         self.transformation_matrix_changed.emit(self.transformation_matrix)
 
     def set_transformation(self, transformation_matrix):
+        transformation_matrix = np.asarray(transformation_matrix)
+        self.transformation_matrix[:] = transformation_matrix
         for cell in self.cells:
-            self.transformation_matrix[cell.row][cell.col] = transformation_matrix[cell.row][cell.col]
-            value = transformation_matrix[cell.row][cell.col]
+            value = transformation_matrix[cell.row, cell.col]
             cell.setText(str(value))
             cell.setCursorPosition(0)
 
@@ -1,10 +1,10 @@
 import math
-import os
+from pathlib import Path
 
 import numpy as np
-from PyQt5.QtCore import QThread, Qt
+from PyQt5.QtCore import QThread, Qt, QMetaObject, QThreadPool, QTimer, QSettings
 from PyQt5.QtWidgets import QMainWindow, QSplitter, QWidget, QGroupBox, QVBoxLayout, \
-    QTabWidget, QSizePolicy, QErrorMessage, QMessageBox, QProgressDialog, QApplication
+    QSizePolicy, QMessageBox, QProgressDialog, QApplication
 
 from src.gui.tabs.cache_tab import CacheTab
 from src.gui.tabs.evaluation_tab import EvaluationTab
@@ -15,6 +15,7 @@ from src.gui.tabs.merger_tab import MergeTab
 from src.gui.tabs.multi_scale_registration_tab import MultiScaleRegistrationTab
 from src.gui.tabs.rasterizer_tab import RasterizerTab
 from src.gui.tabs.visualizer_tab import VisualizerTab
+from src.gui.widgets.lazy_tab_widget import LazyTabWidget
 from src.gui.widgets.transformation_widget import Transformation3DPicker
 from src.gui.windows.image_viewer_window import RasterImageViewer
 from src.gui.windows.open3d_window import Open3DWindow
@@ -24,9 +25,15 @@ from src.gui.workers.qt_local_registrator import LocalRegistrator
 from src.gui.workers.qt_multiscale_registrator import MultiScaleRegistrator
 from src.gui.workers.qt_ransac_registrator import RANSACRegistrator
 from src.gui.workers.qt_rasterizer import RasterizerWorker
-from src.gui.workers.qt_workers import PointCloudSaver
-from src.utils.file_loader import load_plyfile_pc, is_point_cloud_gaussian
-from src.utils.point_cloud_merger import save_merged_point_clouds
+from src.gui.workers.qt_workers import PointCloudSaver, PlyFilePrefetcher, PointCloudMerger
+from src.utils.file_loader import is_point_cloud_gaussian, clear_plyfile_cache, PLYFILE_CACHE_SIZE_LIMIT
+import src.utils.graphics_utils as graphic_util
+
+WORKING_DIR = Path.cwd()
+CACHE_DIR = WORKING_DIR / "cache"
+INPUT_DIR = WORKING_DIR / "inputs"
+OUTPUT_DIR = WORKING_DIR / "output"
+
 
 class RegistrationMainWindow(QMainWindow):
 
@@ -38,6 +45,20 @@ class RegistrationMainWindow(QMainWindow):
         self.pc_originalFirst = None
         self.pc_originalSecond = None
 
+        # Whether the loaded point clouds are Gaussian point clouds, evaluated once at load time
+        self.is_first_gaussian = False
+        self.is_second_gaussian = False
+
+        # View settings that were last applied to the visualizer
+        self.last_view = None
+
+        # Bursts of transformation changes are applied at most once per frame
+        self.pending_transformation = None
+        self.transformation_timer = QTimer(self)
+        self.transformation_timer.setSingleShot(True)
+        self.transformation_timer.setInterval(16)
+        self.transformation_timer.timeout.connect(self.apply_pending_transformation)
+
         # Dataclass that stores the results and parameters of the last local registration
         self.local_registration_data = None
 
@@ -52,14 +73,30 @@ class RegistrationMainWindow(QMainWindow):
         # Image viewer
         self.raster_window = None
 
-        working_dir = os.getcwd()
-        self.cache_dir = os.path.join(working_dir, "cache")
-        self.input_dir = os.path.join(working_dir, "inputs")
-        self.output_dir = os.path.join(working_dir, "output")
+        # Registration, rasterization and evaluation workers share a single thread
+        self.worker_thread = QThread(self)
+        self.worker_thread.start()
+        self.active_worker = None
+
+        # Pool shared by the file operations running in the background: saving, merging and prefetching point clouds
+        self.io_pool = QThreadPool(self)
+        self.io_pool.setMaxThreadCount(2)
+
+        # Input paths of the running merge, None if the preloaded point clouds are merged
+        self.merge_paths = None
+
+        # Point clouds of the last merge are read into the cache in the background, so merging them again does not
+        # wait for the disk
+        self.settings = QSettings("GSR", "paths")
+        self.prefetch_last_merge_pair()
+
+        self.cache_dir = str(CACHE_DIR)
+        self.input_dir = str(INPUT_DIR)
+        self.output_dir = str(OUTPUT_DIR)
 
         # Loading bar for registration
         self.progress_dialog = QProgressDialog()
-        self.progress_dialog.setModal(Qt.WindowModal)
+        self.progress_dialog.setWindowModality(Qt.ApplicationModal)
         self.progress_dialog.setWindowTitle("Loading")
         self.progress_dialog.setStyleSheet("text-align: center;")
         self.progress_dialog.close()
@@ -68,9 +105,9 @@ class RegistrationMainWindow(QMainWindow):
         self.showMaximized()
 
         # Assign size scale to global variable to handle different screen sizes
-        import src.utils.graphics_utils
-        src.utils.graphics_utils.SIZE_SCALE_X = QApplication.primaryScreen().size().width() / 1920
-        src.utils.graphics_utils.SIZE_SCALE_Y = QApplication.primaryScreen().size().height() / 1080
+        screen_size = QApplication.primaryScreen().size()
+        graphic_util.SIZE_SCALE_X = screen_size.width() / 1920
+        graphic_util.SIZE_SCALE_Y = screen_size.height() / 1080
 
         # Create splitter and two planes
         splitter = QSplitter(self)
@@ -99,77 +136,120 @@ class RegistrationMainWindow(QMainWindow):
         self.setCentralWidget(splitter)
 
     def setup_input_group(self, group_input_data):
-        group_input_data.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
         group_input_data.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
         group_input_data.setTitle("Inputs and settings")
         layout = QVBoxLayout()
         group_input_data.setLayout(layout)
 
-        tab_widget = QTabWidget()
+        tab_widget = LazyTabWidget()
         layout.addWidget(tab_widget)
 
-        self.input_tab = InputTab(self.input_dir)
-        self.cache_tab = CacheTab(self.cache_dir)
+        # The transformation is read by every registration handler, so it is created upfront
         self.transformation_picker = Transformation3DPicker()
-        self.visualizer_widget = VisualizerTab()
-        self.rasterizer_tab = RasterizerTab()
-        self.merger_widget = MergeTab(self.output_dir, self.input_dir)
-
         self.transformation_picker.transformation_matrix_changed.connect(self.update_point_clouds)
+
+        tab_widget.add_lazy_tab(self.create_input_tab, "I/O files")
+        tab_widget.add_lazy_tab(self.create_cache_tab, "Cache")
+        tab_widget.addTab(self.transformation_picker, "Transformation")
+        # The debug colors and view settings are read on every transformation change, so they are created upfront too
+        tab_widget.addTab(self.create_visualizer_tab(), "Visualizer")
+        tab_widget.add_lazy_tab(self.create_rasterizer_tab, "Rasterizer")
+        tab_widget.add_lazy_tab(self.create_merger_tab, "Merging")
+
+    def create_input_tab(self):
+        self.input_tab = InputTab(self.input_dir)
         self.input_tab.result_signal.connect(self.handle_result)
+        return self.input_tab
+
+    def create_cache_tab(self):
+        self.cache_tab = CacheTab(self.cache_dir)
         self.cache_tab.result_signal.connect(self.handle_result)
+        return self.cache_tab
+
+    def create_visualizer_tab(self):
+        self.visualizer_widget = VisualizerTab()
         self.visualizer_widget.signal_change_vis.connect(self.change_visualizer)
         self.visualizer_widget.signal_get_current_view.connect(self.get_current_view)
         self.visualizer_widget.signal_pop_visualizer.connect(self.pane_open3d.pop_visualizer)
-        self.merger_widget.signal_merge_point_clouds.connect(self.merge_point_clouds)
+        return self.visualizer_widget
+
+    def create_rasterizer_tab(self):
+        self.rasterizer_tab = RasterizerTab()
         self.rasterizer_tab.signal_rasterize.connect(self.rasterize_gaussians)
+        return self.rasterizer_tab
 
-        tab_widget.addTab(self.input_tab, "I/O files")
-        tab_widget.addTab(self.cache_tab, "Cache")
-        tab_widget.addTab(self.transformation_picker, "Transformation")
-        tab_widget.addTab(self.visualizer_widget, "Visualizer")
-        tab_widget.addTab(self.rasterizer_tab, "Rasterizer")
-        tab_widget.addTab(self.merger_widget, "Merging")
+    def create_merger_tab(self):
+        self.merger_widget = MergeTab(self.output_dir, self.input_dir)
+        self.merger_widget.signal_merge_point_clouds.connect(self.merge_point_clouds)
+        return self.merger_widget
 
     def setup_registration_group(self, group_registration):
-        group_registration.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
         group_registration.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
         layout = QVBoxLayout()
         group_registration.setLayout(layout)
 
-        registration_tab = QTabWidget()
-
-        local_registration_widget = LocalRegistrationTab()
-        local_registration_widget.signal_do_registration.connect(self.do_local_registration)
+        registration_tab = LazyTabWidget()
+        registration_tab.add_lazy_tab(self.create_global_registration_tab, "Global Registration")
+        registration_tab.add_lazy_tab(self.create_local_registration_tab, "Local Registration")
+        registration_tab.add_lazy_tab(self.create_multi_scale_registration_tab, "Multi-scale")
+        registration_tab.add_lazy_tab(self.create_evaluation_tab, "Evaluation")
+        layout.addWidget(registration_tab)
 
+    def create_global_registration_tab(self):
         global_registration_widget = GlobalRegistrationTab()
         global_registration_widget.signal_do_ransac.connect(self.do_ransac_registration)
         global_registration_widget.signal_do_fgr.connect(self.do_fgr_registration)
+        return global_registration_widget
+
+    def create_local_registration_tab(self):
+        local_registration_widget = LocalRegistrationTab()
+        local_registration_widget.signal_do_registration.connect(self.do_local_registration)
+        return local_registration_widget
 
+    def create_multi_scale_registration_tab(self):
         multi_scale_registration_widget = MultiScaleRegistrationTab(self.input_dir)
         multi_scale_registration_widget.signal_do_registration.connect(self.do_multi_scale_registration)
+        return multi_scale_registration_widget
 
+    def create_evaluation_tab(self):
         evaluator_widget = EvaluationTab()
         evaluator_widget.signal_camera_change.connect(self.loaded_camera_changed)
         evaluator_widget.signal_evaluate_registration.connect(self.evaluate_registration)
-
-        registration_tab.addTab(global_registration_widget, "Global Registration")
-        registration_tab.addTab(local_registration_widget, "Local Registration")
-        registration_tab.addTab(multi_scale_registration_widget, "Multi-scale")
-        registration_tab.addTab(multi_scale_registration_widget, "Multi-scale")
-        registration_tab.addTab(evaluator_widget, "Evaluation")
-        layout.addWidget(registration_tab)
+        return evaluator_widget
 
     # Event Handlers
     def update_point_clouds(self, transformation_matrix):
-        if self.visualizer_widget.get_use_debug_color():
-            dc1, dc2 = self.visualizer_widget.get_debug_colors()
-            self.pane_open3d.update_transform_with_colors(dc1, dc2, transformation_matrix)
+        self.pending_transformation = transformation_matrix
+        if not self.transformation_timer.isActive():
+            self.transformation_timer.start()
+
+    def apply_pending_transformation(self):
+        # The camera is only updated if the view settings changed since they were last applied
+        view = self.visualizer_widget.get_current_transformations()
+        if self.is_last_view(*view):
+            view = None
         else:
-            self.pane_open3d.update_transform(transformation_matrix)
+            self.remember_view(*view)
+
+        self.pane_open3d.update_scene(self.pending_transformation, self.get_debug_colors(), view)
 
-        zoom, front, lookat, up = self.visualizer_widget.get_current_transformations()
-        self.pane_open3d.update_visualizer(zoom, front, lookat, up)
+    def get_debug_colors(self):
+        if not self.visualizer_widget.get_use_debug_color():
+            return None
+
+        return self.visualizer_widget.get_debug_colors()
+
+    def is_last_view(self, zoom, front, lookat, up):
+        if self.last_view is None:
+            return False
+
+        last_zoom, last_front, last_lookat, last_up = self.last_view
+        return (zoom == last_zoom and np.array_equal(front, last_front) and np.array_equal(lookat, last_lookat)
+                and np.array_equal(up, last_up))
+
+    def remember_view(self, zoom, front, lookat, up):
+        # The vectors of the visualizer tab are updated in place, so copies are stored
+        self.last_view = (zoom, np.copy(front), np.copy(lookat), np.copy(up))
 
     def handle_result(self, pc_first, pc_second, save_point_clouds, original1=None, original2=None):
         error_message = ('Importing one or both of the point clouds failed.\nPlease check that you entered the correct '
@@ -179,54 +259,102 @@ class RegistrationMainWindow(QMainWindow):
 
         self.pc_originalFirst = original1
         self.pc_originalSecond = original2
+        self.is_first_gaussian = is_point_cloud_gaussian(original1)
+        self.is_second_gaussian = is_point_cloud_gaussian(original2)
 
         if save_point_clouds:
-            worker = PointCloudSaver(pc_first, pc_second)
-            worker.run()
+            self.save_point_clouds(pc_first, pc_second)
 
+        # A pending transformation update is dropped, the current transformation is applied after loading anyway
+        self.transformation_timer.stop()
         self.pane_open3d.load_point_clouds(pc_first, pc_second)
 
-    def change_visualizer(self, use_debug_color, dc1, dc2, zoom, front, lookat, up):
-        if use_debug_color:
-            self.pane_open3d.update_transform_with_colors(dc1, dc2, self.transformation_picker.transformation_matrix)
+        # Loading fits the camera to the new point clouds, which is kept until the next change applies the view
+        # settings again. The current transformation and debug colors are applied right away.
+        self.last_view = None
+        self.pane_open3d.update_scene(self.transformation_picker.transformation_matrix, self.get_debug_colors())
+
+    def save_point_clouds(self, pc_first, pc_second):
+        # The point clouds are not modified after loading, so the saver can share them with the visualizer
+        saver = PointCloudSaver(pc_first, pc_second)
+        saver.signals.signal_finished.connect(self.handle_point_clouds_saved)
+        self.io_pool.start(saver)
+        self.statusBar().showMessage("Saving point clouds to the cache...")
 
-        self.pane_open3d.update_visualizer(zoom, front, lookat, up)
+    def handle_point_clouds_saved(self):
+        self.statusBar().showMessage("Point clouds saved to the cache", 5000)
+
+    def change_visualizer(self, use_debug_color, dc1, dc2, zoom, front, lookat, up):
+        debug_colors = (dc1, dc2) if use_debug_color else None
+        self.remember_view(zoom, front, lookat, up)
+        self.pane_open3d.update_scene(self.transformation_picker.transformation_matrix, debug_colors,
+                                      (zoom, front, lookat, up))
 
     def get_current_view(self):
         zoom, front, lookat, up = self.pane_open3d.get_current_view()
         self.visualizer_widget.assign_new_values(zoom, front, lookat, up)
 
-    def merge_point_clouds(self, is_checked, pc_path1, pc_path2, merge_path):
-        pc_first = self.pc_originalFirst
-        pc_second = self.pc_originalSecond
-
-        if is_checked:
-            pc_first = load_plyfile_pc(pc_path1)
-            pc_second = load_plyfile_pc(pc_path2)
-            error_message = ("Importing one or both of the point clouds failed.\nPlease check that you entered the "
-                             "correct path and the point clouds selected are Gaussian point clouds!")
-            if self.check_if_none_and_throw_error(pc_first, pc_second, error_message):
+    def merge_point_clouds(self, is_checked, reload_inputs, pc_path1, pc_path2, merge_path):
+        if not is_checked:
+            # The type of the preloaded point clouds was determined when they were loaded
+            if not self.is_first_gaussian or not self.is_second_gaussian:
+                self.show_error("There were no preloaded point clouds found! Load a Gaussian point cloud before "
+                                "merging, or check the \"corresponding inputs\" option and select the point clouds "
+                                "you wish to merge.")
                 return
 
-        error_message = ("There were no preloaded point clouds found! Load a Gaussian point cloud before merging, "
-                         "or check the \"corresponding inputs\" option and select the point clouds you wish to merge.")
-        if self.check_if_none_and_throw_error(pc_first, pc_second, error_message):
+            self.merge_paths = None
+            merger = PointCloudMerger(self.pc_originalFirst, self.pc_originalSecond, merge_path,
+                                      self.transformation_picker.transformation_matrix.copy())
+        else:
+            # Previously loaded point clouds are reused unless the user asks for a reload
+            if reload_inputs:
+                clear_plyfile_cache()
+
+            self.merge_paths = (pc_path1, pc_path2)
+            merger = PointCloudMerger(pc_path1, pc_path2, merge_path,
+                                      self.transformation_picker.transformation_matrix.copy())
+
+        # Loading, merging and writing run in the background, the merger tab stays disabled until they are done
+        merger.signals.signal_merge_done.connect(self.handle_merge_done)
+        merger.signals.signal_error_occurred.connect(self.handle_merge_error)
+        self.merger_widget.setEnabled(False)
+        self.io_pool.start(merger)
+        self.statusBar().showMessage("Merging point clouds...")
+
+    def handle_merge_done(self):
+        self.merger_widget.setEnabled(True)
+        self.statusBar().showMessage("Merged point cloud saved", 5000)
+        if self.merge_paths is not None:
+            self.settings.setValue("last_merge_pair", list(self.merge_paths))
+
+    def handle_merge_error(self, message):
+        self.merger_widget.setEnabled(True)
+        self.statusBar().clearMessage()
+        self.show_error(message)
+
+    def prefetch_last_merge_pair(self):
+        last_pair = self.settings.value("last_merge_pair")
+        if not isinstance(last_pair, list) or len(last_pair) != 2:
             return
 
-        save_merged_point_clouds(pc_first, pc_second,
-                                 merge_path, self.transformation_picker.transformation_matrix)
+        # Files too large for the cache would be read for nothing
+        for pc_path in last_pair:
+            path = Path(pc_path)
+            if path.is_file() and path.stat().st_size <= PLYFILE_CACHE_SIZE_LIMIT:
+                self.io_pool.start(PlyFilePrefetcher(pc_path))
 
     def check_if_none_and_throw_error(self, pc_first, pc_second, message):
         if not pc_first or not pc_second:
             # TODO: Further error messages. Tracing?
-            dialog = QErrorMessage(self)
-            dialog.setModal(True)
-            dialog.setWindowTitle("Error")
-            dialog.showMessage(message)
+            self.show_error(message)
             return True
 
         return False
 
+    def show_error(self, message):
+        QMessageBox.critical(self, "Error", message)
+
     def do_local_registration(self, registration_type, max_correspondence,
                               relative_fitness, relative_rmse, max_iteration, rejection_type, k_value):
         # Create worker for local registration
@@ -237,20 +365,18 @@ class RegistrationMainWindow(QMainWindow):
                                              relative_fitness, relative_rmse, max_iteration, rejection_type,
                                              k_value)
 
-        # Create thread
-        thread = QThread(self)
-        # Move worker to thread
-        local_registrator.moveToThread(thread)
+        # Move worker to the shared worker thread
+        local_registrator.moveToThread(self.worker_thread)
         # connect signals to slots
-        thread.started.connect(local_registrator.do_registration)
         local_registrator.signal_registration_done.connect(self.handle_registration_result)
-        local_registrator.signal_finished.connect(thread.quit)
+        local_registrator.signal_finished.connect(self.progress_dialog.close)
         local_registrator.signal_finished.connect(local_registrator.deleteLater)
-        thread.finished.connect(thread.deleteLater)
 
-        thread.start()
+        # Keep a reference until the worker deletes itself
+        self.active_worker = local_registrator
+        QMetaObject.invokeMethod(local_registrator, "do_registration", Qt.QueuedConnection)
         self.progress_dialog.setLabelText("Registering point clouds...")
-        self.progress_dialog.exec()
+        self.progress_dialog.show()
 
     def do_ransac_registration(self, voxel_size, mutual_filter, max_correspondence, estimation_method,
                                ransac_n, checkers, max_iteration, confidence):
@@ -262,20 +388,18 @@ class RegistrationMainWindow(QMainWindow):
                                                voxel_size, mutual_filter, max_correspondence,
                                                estimation_method, ransac_n, checkers, max_iteration, confidence)
 
-        # Create thread
-        thread = QThread(self)
-        # Move worker to thread
-        ransac_registrator.moveToThread(thread)
+        # Move worker to the shared worker thread
+        ransac_registrator.moveToThread(self.worker_thread)
         # connect signals to slots
-        thread.started.connect(ransac_registrator.do_registration)
         ransac_registrator.signal_registration_done.connect(self.handle_registration_result)
-        ransac_registrator.signal_finished.connect(thread.quit)
+        ransac_registrator.signal_finished.connect(self.progress_dialog.close)
         ransac_registrator.signal_finished.connect(ransac_registrator.deleteLater)
-        thread.finished.connect(thread.deleteLater)
 
-        thread.start()
+        # Keep a reference until the worker deletes itself
+        self.active_worker = ransac_registrator
+        QMetaObject.invokeMethod(ransac_registrator, "do_registration", Qt.QueuedConnection)
         self.progress_dialog.setLabelText("Registering point clouds...")
-        self.progress_dialog.exec()
+        self.progress_dialog.show()
 
     def do_fgr_registration(self, voxel_size, division_factor, use_absolute_scale, decrease_mu, maximum_correspondence,
                             max_iterations, tuple_scale, max_tuple_count, tuple_test):
@@ -287,20 +411,18 @@ class RegistrationMainWindow(QMainWindow):
                                          maximum_correspondence,
                                          max_iterations, tuple_scale, max_tuple_count, tuple_test)
 
-        # Create thread
-        thread = QThread(self)
-        # Move worker to thread
-        fgr_registrator.moveToThread(thread)
+        # Move worker to the shared worker thread
+        fgr_registrator.moveToThread(self.worker_thread)
         # connect signals to slots
-        thread.started.connect(fgr_registrator.do_registration)
         fgr_registrator.signal_registration_done.connect(self.handle_registration_result)
-        fgr_registrator.signal_finished.connect(thread.quit)
+        fgr_registrator.signal_finished.connect(self.progress_dialog.close)
         fgr_registrator.signal_finished.connect(fgr_registrator.deleteLater)
-        thread.finished.connect(thread.deleteLater)
 
-        thread.start()
+        # Keep a reference until the worker deletes itself
+        self.active_worker = fgr_registrator
+        QMetaObject.invokeMethod(fgr_registrator, "do_registration", Qt.QueuedConnection)
         self.progress_dialog.setLabelText("Registering point clouds...")
-        self.progress_dialog.exec()
+        self.progress_dialog.show()
 
     def handle_registration_result(self, results, data):
         self.progress_dialog.close()
@@ -329,21 +451,19 @@ class RegistrationMainWindow(QMainWindow):
                                                         relative_rmse, voxel_values, iter_values,
                                                         rejection_type, k_value)
 
-        # Create thread
-        thread = QThread(self)
-        # Move worker to thread
-        multi_scale_registrator.moveToThread(thread)
+        # Move worker to the shared worker thread
+        multi_scale_registrator.moveToThread(self.worker_thread)
         # connect signals to slots
-        thread.started.connect(multi_scale_registrator.do_registration)
         multi_scale_registrator.signal_registration_done.connect(self.handle_registration_result)
         multi_scale_registrator.signal_error_occurred.connect(self.create_error_list_dialog)
-        multi_scale_registrator.signal_finished.connect(thread.quit)
+        multi_scale_registrator.signal_finished.connect(self.progress_dialog.close)
         multi_scale_registrator.signal_finished.connect(multi_scale_registrator.deleteLater)
-        thread.finished.connect(thread.deleteLater)
 
-        thread.start()
+        # Keep a reference until the worker deletes itself
+        self.active_worker = multi_scale_registrator
+        QMetaObject.invokeMethod(multi_scale_registrator, "do_registration", Qt.QueuedConnection)
         self.progress_dialog.setLabelText("Registering point clouds...")
-        self.progress_dialog.exec()
+        self.progress_dialog.show()
 
     def rasterize_gaussians(self, width, height, scale, color, intrinsics_supplied):
         pc1 = self.pc_originalFirst
@@ -351,42 +471,34 @@ class RegistrationMainWindow(QMainWindow):
 
         error_message = ('One or both of the point clouds loaded are not of the correct type.'
                          '\nLoad two Gaussian point clouds for rasterization!')
-        if not is_point_cloud_gaussian(pc1) or not is_point_cloud_gaussian(pc2):
-            dialog = QErrorMessage(self)
-            dialog.setModal(True)
-            dialog.setWindowTitle("Error")
-            dialog.showMessage(error_message)
+        if not self.is_first_gaussian or not self.is_second_gaussian:
+            self.show_error(error_message)
             return
 
         if self.pane_open3d.is_ortho():
-            dialog = QErrorMessage(self)
-            dialog.setModal(True)
-            dialog.setWindowTitle("Error")
-            dialog.showMessage("The current projection type is orthographical, which is invalid for rasterization.\n"
-                               "Increase the FOV to continue!")
+            self.show_error("The current projection type is orthographical, which is invalid for rasterization.\n"
+                            "Increase the FOV to continue!")
             return
 
-        extrinsic = self.pane_open3d.get_camera_extrinsic().astype(np.float32)
+        extrinsic = np.asarray(self.pane_open3d.get_camera_extrinsic(), dtype=np.float32)
         intrinsic = intrinsics_supplied
         if intrinsic is None:
-            intrinsic = self.pane_open3d.get_camera_intrinsic().astype(np.float32)
+            intrinsic = np.asarray(self.pane_open3d.get_camera_intrinsic(), dtype=np.float32)
         rasterizer = RasterizerWorker(pc1, pc2, self.transformation_picker.transformation_matrix,
                                       extrinsic, intrinsic, scale, color, height, width)
 
-        # Create thread
-        thread = QThread(self)
-        # Move worker to thread
-        rasterizer.moveToThread(thread)
+        # Move worker to the shared worker thread
+        rasterizer.moveToThread(self.worker_thread)
         # connect signals to slots
-        thread.started.connect(rasterizer.do_rasterization)
         rasterizer.signal_rasterization_done.connect(self.create_raster_window)
-        rasterizer.signal_finished.connect(thread.quit)
+        rasterizer.signal_finished.connect(self.progress_dialog.close)
         rasterizer.signal_finished.connect(rasterizer.deleteLater)
-        thread.finished.connect(thread.deleteLater)
 
-        thread.start()
+        # Keep a reference until the worker deletes itself
+        self.active_worker = rasterizer
+        QMetaObject.invokeMethod(rasterizer, "do_rasterization", Qt.QueuedConnection)
         self.progress_dialog.setLabelText("Creating rasterized image...")
-        self.progress_dialog.exec()
+        self.progress_dialog.show()
 
     def create_raster_window(self, pix):
         self.progress_dialog.close()
@@ -404,57 +516,51 @@ class RegistrationMainWindow(QMainWindow):
         pc2 = self.pc_originalSecond
 
         if not pc1 or not pc2:
-            dialog = QErrorMessage(self)
-            dialog.setModal(True)
-            dialog.setWindowTitle("Error")
-            dialog.showMessage("There are no gaussian point clouds loaded for registration evaluation!"
-                               "\nPlease load two point clouds for registration and evaluation")
+            self.show_error("There are no gaussian point clouds loaded for registration evaluation!"
+                            "\nPlease load two point clouds for registration and evaluation")
             return
 
         worker = RegistrationEvaluator(pc1, pc2, self.transformation_picker.transformation_matrix,
                                        camera_list, image_path, log_path, color, self.local_registration_data,
                                        use_gpu)
 
-        # Create thread
-        thread = QThread(self)
-        # Move worker to thread
-        worker.moveToThread(thread)
+        # Move worker to the shared worker thread
+        worker.moveToThread(self.worker_thread)
         # connect signals to slots
-        thread.started.connect(worker.do_evaluation)
         worker.signal_evaluation_done.connect(self.handle_evaluation_result)
-        worker.signal_finished.connect(thread.quit)
+        worker.signal_finished.connect(self.progress_dialog.close)
         worker.signal_finished.connect(worker.deleteLater)
-        thread.finished.connect(thread.deleteLater)
 
         self.progress_dialog.setLabelText("Evaluating registration...")
         self.progress_dialog.setRange(0, 100)
         self.progress_dialog.canceled.connect(worker.cancel_evaluation)
         worker.signal_update_progress.connect(self.progress_dialog.setValue)
 
-        thread.start()
-        self.progress_dialog.exec()
+        # Keep a reference until the worker deletes itself
+        self.active_worker = worker
+        QMetaObject.invokeMethod(worker, "do_evaluation", Qt.QueuedConnection)
+        self.progress_dialog.show()
 
     def handle_evaluation_result(self, log_object):
         self.progress_dialog.close()
         message_dialog = QMessageBox()
         message_dialog.setModal(True)
         message_dialog.setWindowTitle("Evaluation finished")
-        message = "The evaluation finished with"
         if not math.isnan(log_object.psnr):
-            message += " success.\n"
-            message += f"\nMSE:  {log_object.mse}"
-            message += f"\nRMSE: {log_object.rmse}"
-            message += f"\nSSIM: {log_object.ssim}"
-            message += f"\nPSNR: {log_object.psnr}"
-            message += f"\nLPIP: {log_object.lpips}"
+            parts = ["The evaluation finished with success.\n",
+                     f"MSE:  {log_object.mse}",
+                     f"RMSE: {log_object.rmse}",
+                     f"SSIM: {log_object.ssim}",
+                     f"PSNR: {log_object.psnr}",
+                     f"LPIP: {log_object.lpips}"]
         else:
-            message += " error."
+            parts = ["The evaluation finished with error."]
 
         if log_object.error_list:
-            message += "\nClick \"Show details\" for any potential issues."
+            parts.append("Click \"Show details\" for any potential issues.")
             message_dialog.setDetailedText("\n".join(log_object.error_list))
 
-        message_dialog.setText(message)
+        message_dialog.setText("\n".join(parts))
         message_dialog.exec()
 
     def create_error_list_dialog(self, error_list):
@@ -465,3 +571,11 @@ class RegistrationMainWindow(QMainWindow):
         message_dialog.setText("The following error(s) occurred.\n Click \"Show details\" for more information!")
         message_dialog.setDetailedText("\n".join(error_list))
         message_dialog.exec()
+
+    def closeEvent(self, event):
+        self.worker_thread.quit()
+        self.worker_thread.wait()
+        # Operations that did not start yet are dropped, running ones finish so no file is left half written
+        self.io_pool.clear()
+        self.io_pool.waitForDone()
+        super().closeEvent(event)
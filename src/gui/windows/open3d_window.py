@@ -21,6 +21,10 @@ class Open3DWindow(QMainWindow):
         self.pc1 = None
         self.pc2 = None
 
+        # Homogeneous coordinates of the first point cloud, used for transforming the displayed copy
+        self.points_homogeneous = None
+        self.applied_debug_colors = None
+
         self.parent_widget = QtWidgets.QWidget()
         self.layout = QtWidgets.QGridLayout(self.parent_widget)
         self.setCentralWidget(self.parent_widget)
@@ -57,12 +61,7 @@ class Open3DWindow(QMainWindow):
                                  [0.0, 1.0, 0.0, 0.0], [0.0, 0.0, 0.0, 1.0]])
         source.transform(trans_init)
 
-        self.pc1_copy = source
-        self.pc2_copy = target
-        self.pc1 = source
-        self.pc2 = target
-        self.vis.add_geometry(self.pc1_copy)
-        self.vis.add_geometry(self.pc2_copy)
+        self.load_point_clouds(source, target)
 
     def update_vis(self):
         self.vis.poll_events()
@@ -71,44 +70,82 @@ class Open3DWindow(QMainWindow):
     def load_point_clouds(self, point_cloud_first, point_cloud_second):
         self.pc1 = point_cloud_first
         self.pc2 = point_cloud_second
-        self.pc1_copy = self.pc1
-        self.pc2_copy = self.pc2
-
-        self.vis.clear_geometries()
-        self.vis.add_geometry(point_cloud_first)
-        self.vis.add_geometry(point_cloud_second)
-
-    def closeEvent(self, event):
-        self.vis.destroy_window()
-        super(QMainWindow, self).closeEvent(event)
-
-    def update_transform(self, transformation):
-        if not self.pc1 or not self.pc2:
-            return
 
+        # The displayed copies are updated in place on every transformation change
         self.pc1_copy = copy.deepcopy(self.pc1)
         self.pc2_copy = copy.deepcopy(self.pc2)
-        self.pc1_copy.transform(transformation)
+        self.applied_debug_colors = None
+
+        points = np.asarray(self.pc1.points)
+        self.points_homogeneous = np.hstack((points, np.ones((points.shape[0], 1), dtype=np.float64)))
 
         self.vis.clear_geometries()
         self.vis.add_geometry(self.pc1_copy)
         self.vis.add_geometry(self.pc2_copy)
 
-    def update_transform_with_colors(self, debug_color1, debug_color2, transformation):
-        if not self.pc1 or not self.pc2:
-            return
+    def closeEvent(self, event):
+        self.vis.destroy_window()
+        super(QMainWindow, self).closeEvent(event)
 
-        self.pc1_copy = copy.deepcopy(self.pc1)
-        self.pc2_copy = copy.deepcopy(self.pc2)
+    def update_transform(self, transformation):
+        self.update_scene(transformation)
 
-        self.pc1_copy.paint_uniform_color(debug_color1)
-        self.pc2_copy.paint_uniform_color(debug_color2)
+    def update_transform_with_colors(self, debug_color1, debug_color2, transformation):
+        self.update_scene(transformation, (debug_color1, debug_color2))
+
+    def update_scene(self, transformation, debug_colors=None, view=None):
+        # Applies the transformation, the debug colors and the view together, updating each geometry once
+        if self.pc1 and self.pc2:
+            # The copies are only repainted when the debug colors differ from the ones applied last
+            update_second = False
+            if debug_colors is not None:
+                if not self.are_debug_colors_applied(debug_colors):
+                    self.paint_copy(self.pc1_copy, debug_colors[0])
+                    self.paint_copy(self.pc2_copy, debug_colors[1])
+                    self.applied_debug_colors = (np.copy(debug_colors[0]), np.copy(debug_colors[1]))
+                    update_second = True
+            elif self.applied_debug_colors is not None:
+                self.restore_colors(self.pc1, self.pc1_copy)
+                self.restore_colors(self.pc2, self.pc2_copy)
+                self.applied_debug_colors = None
+                update_second = True
+
+            self.transform_copy(transformation)
+            self.vis.update_geometry(self.pc1_copy)
+            if update_second:
+                self.vis.update_geometry(self.pc2_copy)
+
+        if view is not None:
+            self.update_visualizer(*view)
+
+    def are_debug_colors_applied(self, debug_colors):
+        if self.applied_debug_colors is None:
+            return False
+
+        return (np.array_equal(debug_colors[0], self.applied_debug_colors[0])
+                and np.array_equal(debug_colors[1], self.applied_debug_colors[1]))
+
+    def transform_copy(self, transformation):
+        # Writes the transformed points straight into the buffer of the displayed point cloud
+        transformation = np.asarray(transformation, dtype=np.float64)
+        np.matmul(self.points_homogeneous, transformation[:3].T, out=np.asarray(self.pc1_copy.points))
+        if self.pc1.has_normals():
+            np.matmul(np.asarray(self.pc1.normals), transformation[:3, :3].T, out=np.asarray(self.pc1_copy.normals))
 
-        self.pc1_copy.transform(transformation)
+    @staticmethod
+    def paint_copy(point_cloud_copy, color):
+        # The color is broadcast into the existing color buffer, a new one is only allocated if there is none
+        if point_cloud_copy.has_colors():
+            np.asarray(point_cloud_copy.colors)[:] = color
+        else:
+            point_cloud_copy.paint_uniform_color(color)
 
-        self.vis.clear_geometries()
-        self.vis.add_geometry(self.pc1_copy)
-        self.vis.add_geometry(self.pc2_copy)
+    @staticmethod
+    def restore_colors(point_cloud, point_cloud_copy):
+        if point_cloud.has_colors():
+            np.asarray(point_cloud_copy.colors)[:] = np.asarray(point_cloud.colors)
+        else:
+            point_cloud_copy.colors = o3d.utility.Vector3dVector()
 
     def update_visualizer(self, zoom, front, lookat, up):
         view_control = self.vis.get_view_control()
@@ -1,11 +1,12 @@
 import copy
+import gc
 import json
 import os.path
 
 import torch
 from PIL import Image
 from PyQt5 import QtWidgets
-from PyQt5.QtCore import QObject, pyqtSignal
+from PyQt5.QtCore import QObject, pyqtSignal, pyqtSlot
 import torchvision.transforms.functional as tf
 
 from src.models.gaussian_model import GaussianModel
@@ -51,6 +52,7 @@ class RegistrationEvaluator(QObject):
         self.current_progress = 0
         self.max_progress = len(cameras_list)
 
+    @pyqtSlot()
     def do_evaluation(self):
         merged_pc = merge_point_clouds(self.pc1, self.pc2, self.transformation)
         point_cloud = GaussianModel(3)
@@ -70,7 +72,6 @@ class RegistrationEvaluator(QObject):
             if self.signal_cancel:
                 # Force gpu memory garbage collection
                 torch.cuda.empty_cache()
-                import gc
                 gc.collect()
                 return
 
@@ -107,7 +108,6 @@ class RegistrationEvaluator(QObject):
         log = self.create_and_save_log_file(error_list)
 
         torch.cuda.empty_cache()
-        import gc
         gc.collect()
 
         self.signal_evaluation_done.emit(log)
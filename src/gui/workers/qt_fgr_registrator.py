@@ -1,6 +1,6 @@
 import copy
 
-from PyQt5.QtCore import QObject, pyqtSignal
+from PyQt5.QtCore import QObject, pyqtSignal, pyqtSlot
 
 from src.utils.global_registration_util import do_fgr_registration
 
@@ -28,6 +28,7 @@ class FGRRegistrator(QObject):
         self.max_tuple_count = max_tuple_count
         self.tuple_test = tuple_test
 
+    @pyqtSlot()
     def do_registration(self):
         results = do_fgr_registration(self.pc1, self.pc2, self.voxel_size,
                                       self.division_factor,
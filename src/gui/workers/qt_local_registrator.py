@@ -1,6 +1,6 @@
 import copy
 
-from PyQt5.QtCore import QObject, pyqtSignal
+from PyQt5.QtCore import QObject, pyqtSignal, pyqtSlot
 
 from src.models.registration_data import LocalRegistrationData
 from src.utils.local_registration_util import do_icp_registration
@@ -25,6 +25,7 @@ class LocalRegistrator(QObject):
         self.rejection_type = rejection_type
         self.k_value = k_value
 
+    @pyqtSlot()
     def do_registration(self):
         results = do_icp_registration(self.pc1, self.pc2, self.init_trans, self.registration_type,
                                       self.max_correspondence, self.relative_fitness,
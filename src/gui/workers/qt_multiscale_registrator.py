@@ -1,6 +1,6 @@
 import copy
 
-from PyQt5.QtCore import QObject, pyqtSignal
+from PyQt5.QtCore import QObject, pyqtSignal, pyqtSlot
 
 from src.models.registration_data import MultiScaleRegistrationData
 from src.utils.file_loader import load_sparse_pc
@@ -32,6 +32,7 @@ class MultiScaleRegistrator(QObject):
         self.rejection_type = rejection_type
         self.k_value = k_value
 
+    @pyqtSlot()
     def do_registration(self):
         current_trans = self.init_trans
         results = None
@@ -1,6 +1,6 @@
 import copy
 
-from PyQt5.QtCore import QObject, pyqtSignal
+from PyQt5.QtCore import QObject, pyqtSignal, pyqtSlot
 
 from src.utils.global_registration_util import do_ransac_registration
 
@@ -27,6 +27,7 @@ class RANSACRegistrator(QObject):
         self.max_iteration = max_iteration
         self.confidence = confidence
 
+    @pyqtSlot()
     def do_registration(self):
         results = do_ransac_registration(self.pc1, self.pc2, self.voxel_size,
                                          self.mutual_filter,
@@ -4,7 +4,7 @@ import numpy as np
 import torch
 from PIL import Image
 from PyQt5 import QtGui
-from PyQt5.QtCore import QObject, pyqtSignal
+from PyQt5.QtCore import QObject, pyqtSignal, pyqtSlot
 
 from src.models.cameras import Camera
 from src.models.gaussian_model import GaussianModel
@@ -37,6 +37,7 @@ class RasterizerWorker(QObject):
         self.fov_x = focal2fov(fx, img_width)
         self.fov_y = focal2fov(fy, img_height)
 
+    @pyqtSlot()
     def do_rasterization(self):
         with torch.no_grad():
             merged_pc = merge_point_clouds(self.pc1, self.pc2, self.transformation)
@@ -1,6 +1,8 @@
-from PyQt5.QtCore import QThread, pyqtSignal
+from PyQt5.QtCore import QObject, QRunnable, QThread, pyqtSignal
 
-from src.utils.file_loader import load_sparse_pc, load_gaussian_pc, load_o3d_pc, save_point_clouds_to_cache
+from src.utils.file_loader import load_sparse_pc, load_gaussian_pc, load_o3d_pc, load_plyfile_pc_cached, \
+    save_point_clouds_to_cache
+from src.utils.point_cloud_merger import save_merged_point_clouds
 
 
 class PointCloudLoaderInput(QThread):
@@ -51,12 +53,71 @@ class PointCloudLoaderO3D(QThread):
         self.result_signal.emit(result1, result2)
 
 
-class PointCloudSaver(QThread):
+# QRunnable cannot emit signals itself, so they are held by a separate QObject
+class PointCloudSaverSignals(QObject):
+    signal_finished = pyqtSignal()
+
+
+class PointCloudSaver(QRunnable):
 
     def __init__(self, point_cloud1, point_cloud2):
         super().__init__()
         self.point_cloud1 = point_cloud1
         self.point_cloud2 = point_cloud2
+        self.signals = PointCloudSaverSignals()
 
     def run(self):
         save_point_clouds_to_cache(self.point_cloud1, self.point_cloud2)
+        self.signals.signal_finished.emit()
+
+
+# Reads a point cloud into the cache, nothing is reported as the result is only used by a later merge
+class PlyFilePrefetcher(QRunnable):
+
+    def __init__(self, pc_path):
+        super().__init__()
+        self.pc_path = pc_path
+
+    def run(self):
+        load_plyfile_pc_cached(self.pc_path)
+
+
+class PointCloudMergerSignals(QObject):
+    signal_merge_done = pyqtSignal()
+    signal_error_occurred = pyqtSignal(str)
+
+
+class PointCloudMerger(QRunnable):
+
+    # The inputs are either loaded Gaussian point clouds or the paths of the files to load them from
+    def __init__(self, pc_first, pc_second, merge_path, transformation_matrix):
+        super().__init__()
+        self.pc_first = pc_first
+        self.pc_second = pc_second
+        self.merge_path = merge_path
+        self.transformation_matrix = transformation_matrix
+        self.signals = PointCloudMergerSignals()
+
+    def run(self):
+        pc_first = self.load_input(self.pc_first)
+        pc_second = self.load_input(self.pc_second)
+        if not pc_first or not pc_second:
+            self.signals.signal_error_occurred.emit("Importing one or both of the point clouds failed.\nPlease check "
+                                                    "that you entered the correct path and the point clouds "
+                                                    "selected are Gaussian point clouds!")
+            return
+
+        try:
+            save_merged_point_clouds(pc_first, pc_second, self.merge_path, self.transformation_matrix)
+        except OSError as error:
+            self.signals.signal_error_occurred.emit(f"Saving the merged point cloud failed.\n{error}")
+            return
+
+        self.signals.signal_merge_done.emit()
+
+    @staticmethod
+    def load_input(point_cloud):
+        if isinstance(point_cloud, str):
+            return load_plyfile_pc_cached(point_cloud)
+
+        return point_cloud
@@ -1,5 +1,6 @@
 from datetime import datetime
 from enum import Enum
+from functools import lru_cache
 
 import plyfile
 import os.path
@@ -9,6 +10,9 @@ import open3d as o3d
 
 PointCloudType = Enum('PointCloudType', 'input gaussian unknow')
 
+# Point cloud files larger than this are not kept in the cache
+PLYFILE_CACHE_SIZE_LIMIT = 1024 ** 3
+
 
 def load_sparse_pc(pc_path):
     if not os.path.isfile(pc_path):
@@ -38,11 +42,11 @@ def load_o3d_pc(pc_path):
     return o3d.io.read_point_cloud(pc_path)
 
 
-def load_plyfile_pc(pc_path):
+def load_plyfile_pc(pc_path, mmap=True):
     if not os.path.isfile(pc_path):
         return None
 
-    point_cloud_plyfile = plyfile.PlyData.read(pc_path)
+    point_cloud_plyfile = plyfile.PlyData.read(pc_path, mmap=mmap)
 
     pc_type = check_point_cloud_type(point_cloud_plyfile)
     if pc_type is not PointCloudType.gaussian:
@@ -51,6 +55,30 @@ def load_plyfile_pc(pc_path):
     return point_cloud_plyfile
 
 
+def load_plyfile_pc_cached(pc_path):
+    if not os.path.isfile(pc_path):
+        return None
+
+    # Larger files are read on every use instead of being held in memory for the whole session
+    stat = os.stat(pc_path)
+    if stat.st_size > PLYFILE_CACHE_SIZE_LIMIT:
+        return load_plyfile_pc(pc_path)
+
+    # A modified file gets a new key, so stale point clouds are never returned
+    return _load_plyfile_pc_by_key((os.path.abspath(pc_path), stat.st_mtime_ns, stat.st_size))
+
+
+# The cached point clouds are read into memory, a memory-mapped file would stay locked on Windows while cached.
+# Only the last pair is kept, as each of them can take up to PLYFILE_CACHE_SIZE_LIMIT bytes.
+@lru_cache(maxsize=2)
+def _load_plyfile_pc_by_key(key):
+    return load_plyfile_pc(key[0], mmap=False)
+
+
+def clear_plyfile_cache():
+    _load_plyfile_pc_by_key.cache_clear()
+
+
 def check_point_cloud_type(point_cloud):
     props = [p.name for p in point_cloud['vertex'].properties]
 
@@ -13,15 +13,13 @@ def convert_input_pc_to_open3d_pc(pc):
 
     # Convert coordinates
     vertices = pc["vertex"]
-    points = np.vstack([vertices['x'], vertices['y'], vertices['z']]).T
-    o3d_pc.points.extend(points)
-    reds = list(map(lambda x: x / 255, vertices['red']))
-    greens = list(map(lambda x: x / 255, vertices['green']))
-    blues = list(map(lambda x: x / 255, vertices['blue']))
+    points = np.stack((vertices['x'], vertices['y'], vertices['z']), axis=1, dtype=np.float64)
+    o3d_pc.points = o3d.utility.Vector3dVector(points)
 
     # Convert color data
-    colors = np.vstack([reds, greens, blues]).T
-    o3d_pc.colors.extend(colors)
+    colors = np.stack((vertices['red'], vertices['green'], vertices['blue']), axis=1, dtype=np.float64)
+    colors /= 255
+    o3d_pc.colors = o3d.utility.Vector3dVector(colors)
 
     o3d_pc.estimate_normals()
 
@@ -2,9 +2,20 @@ import copy
 
 import numpy as np
 import plyfile
+import torch
 
 from src.utils.math_util import matrices_to_quaternions, convert_quaternions_to_rot_matrix, get_wigner_from_rotation
 
+# Numba is optional, without it the transformation falls back to NumPy
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+# Below this many Gaussians, copying them to the GPU and creating the CUDA context costs more than transforming them
+# with NumPy on the CPU
+CUDA_MIN_GAUSSIANS = 1_000_000
+
 
 def save_merged_point_clouds(pc1, pc2, output_path, transformation_matrix=None):
     out_ply_data = merge_point_clouds(pc1, pc2, transformation_matrix)
@@ -12,15 +23,17 @@ def save_merged_point_clouds(pc1, pc2, output_path, transformation_matrix=None):
 
 
 def merge_point_clouds(pc1, pc2, transformation_matrix=None):
-    pc1_copy = copy.deepcopy(pc1)
-    pc2_copy = copy.deepcopy(pc2)
+    # Only the first point cloud is modified, and only if it is transformed. The inputs are usually memory-mapped
+    # by plyfile, so skipping the copies keeps them on disk until they are concatenated.
+    pc1_copy = pc1
 
     # calculate the new positions for the transformation if needed
     if transformation_matrix is not None:
+        pc1_copy = copy.deepcopy(pc1)
         transform_point_cloud(pc1_copy, transformation_matrix)
 
     vertex_data1 = pc1_copy["vertex"].data
-    vertex_data2 = pc2_copy["vertex"].data
+    vertex_data2 = pc2["vertex"].data
 
     out_vertex_data = np.concatenate([vertex_data1, vertex_data2])
     out_vertex_element = plyfile.PlyElement.describe(out_vertex_data, "vertex", len_types={}, val_types={},
@@ -73,29 +86,120 @@ def rotate_sh(pc, points, transformation_matrix):
 
 def transform_point_cloud(pc, transformation_matrix):
     vertex_data = pc["vertex"].data
+    transformation_matrix = np.asarray(transformation_matrix, dtype=np.float64)
+    rotation = np.ascontiguousarray(transformation_matrix[:3, :3])
+    translation = np.ascontiguousarray(transformation_matrix[:3, 3])
 
-    points = np.vstack([vertex_data['x'], vertex_data['y'], vertex_data['z'], np.ones(vertex_data["x"].shape)]).T
-    transformed_points = np.dot(transformation_matrix, points.T).T[:, :3]
+    points = np.stack((vertex_data['x'], vertex_data['y'], vertex_data['z']), axis=1, dtype=np.float64)
 
-    # Update the coordinates in the PLY data
+    rot_names = [p.name for p in pc["vertex"].properties if p.name.startswith("rot")]
+    rot_names = sorted(rot_names, key=lambda x: int(x.split('_')[-1]))
+    quaternions = np.stack([vertex_data[attr_name] for attr_name in rot_names], axis=1, dtype=np.float64)
+
+    # The Numba kernel is memory-bound on the CPU and outruns the copies to and from the GPU, so CUDA is only used
+    # without Numba and for large point clouds
+    if _transform_gaussians_numba is not None:
+        transformed_points = np.empty_like(points)
+        new_quaternions = np.empty_like(quaternions)
+        _transform_gaussians_numba(points, quaternions, rotation, translation, transformed_points, new_quaternions)
+    elif len(points) >= CUDA_MIN_GAUSSIANS and torch.cuda.is_available():
+        transformed_points, new_quaternions = transform_gaussians_torch(points, quaternions, rotation, translation,
+                                                                        "cuda")
+    else:
+        transformed_points, new_quaternions = transform_gaussians(points, quaternions, rotation, translation)
+
+    # Update the coordinates and rotations in the PLY data
     vertex_data['x'] = transformed_points[:, 0]
     vertex_data['y'] = transformed_points[:, 1]
     vertex_data['z'] = transformed_points[:, 2]
 
-    # Get quaternions and convert them to rotation matrices
-    rot_names = [p.name for p in pc["vertex"].properties if p.name.startswith("rot")]
-    rot_names = sorted(rot_names, key=lambda x: int(x.split('_')[-1]))
-    quaternions = np.zeros((points.shape[0], len(rot_names)))
-    for idx, attr_name in enumerate(rot_names):
-        quaternions[:, idx] = np.asarray(pc.elements[0][attr_name])
-
-    new_rotation = convert_quaternions_to_rot_matrix(quaternions)
-    new_rotation = transformation_matrix[:3, :3] @ new_rotation
-
-    # Get back new quaternions
-    quaternions = matrices_to_quaternions(new_rotation)
-
-    vertex_data['rot_0'] = quaternions[:, 0]
-    vertex_data['rot_1'] = quaternions[:, 1]
-    vertex_data['rot_2'] = quaternions[:, 2]
-    vertex_data['rot_3'] = quaternions[:, 3]
+    vertex_data['rot_0'] = new_quaternions[:, 0]
+    vertex_data['rot_1'] = new_quaternions[:, 1]
+    vertex_data['rot_2'] = new_quaternions[:, 2]
+    vertex_data['rot_3'] = new_quaternions[:, 3]
+
+
+def transform_gaussians(points, quaternions, rotation, translation):
+    # Rotate and translate without building homogeneous coordinates, the translation is added in place
+    transformed_points = points @ rotation.T
+    transformed_points += translation
+
+    # Convert the quaternions to rotation matrices, rotate them and get back the new quaternions
+    new_rotation = rotation @ convert_quaternions_to_rot_matrix(quaternions)
+    return transformed_points, matrices_to_quaternions(new_rotation)
+
+
+def transform_gaussians_torch(points, quaternions, rotation, translation, device):
+    # Same computation as transform_gaussians, executed as batched tensor operations on the given device. The PLY
+    # files store float32, so the data is copied and transformed in single precision, which consumer GPUs are fast at.
+    with torch.no_grad():
+        points_tensor = torch.from_numpy(points).to(device, torch.float32)
+        quaternions_tensor = torch.from_numpy(quaternions).to(device, torch.float32)
+        rotation_tensor = torch.from_numpy(rotation).to(device, torch.float32)
+        translation_tensor = torch.from_numpy(translation).to(device, torch.float32)
+
+        transformed_points = torch.addmm(translation_tensor, points_tensor, rotation_tensor.T)
+
+        q = quaternions_tensor / torch.linalg.norm(quaternions_tensor, dim=1, keepdim=True)
+        r, x, y, z = q.unbind(dim=1)
+        old_rotation = torch.stack((1 - 2 * (y * y + z * z), 2 * (x * y - r * z), 2 * (x * z + r * y),
+                                    2 * (x * y + r * z), 1 - 2 * (x * x + z * z), 2 * (y * z - r * x),
+                                    2 * (x * z - r * y), 2 * (y * z + r * x), 1 - 2 * (x * x + y * y)),
+                                   dim=1).view(-1, 3, 3)
+        new_rotation = rotation_tensor @ old_rotation
+
+        w = torch.sqrt(1 + new_rotation.diagonal(dim1=1, dim2=2).sum(dim=1)) / 2
+        new_quaternions = torch.stack((w,
+                                       (new_rotation[:, 2, 1] - new_rotation[:, 1, 2]) / (4 * w),
+                                       (new_rotation[:, 0, 2] - new_rotation[:, 2, 0]) / (4 * w),
+                                       (new_rotation[:, 1, 0] - new_rotation[:, 0, 1]) / (4 * w)), dim=1)
+
+        return transformed_points.cpu().numpy(), new_quaternions.cpu().numpy()
+
+
+if njit is not None:
+    # Same computation as transform_gaussians, fused into a single pass over the points
+    @njit(parallel=True, cache=True, fastmath=True)
+    def _transform_gaussians_numba(points, quaternions, rotation, translation, out_points, out_quaternions):
+        for i in prange(points.shape[0]):
+            px = points[i, 0]
+            py = points[i, 1]
+            pz = points[i, 2]
+            for row in range(3):
+                out_points[i, row] = (rotation[row, 0] * px + rotation[row, 1] * py + rotation[row, 2] * pz
+                                      + translation[row])
+
+            norm = np.sqrt(quaternions[i, 0] ** 2 + quaternions[i, 1] ** 2 +
+                           quaternions[i, 2] ** 2 + quaternions[i, 3] ** 2)
+            r = quaternions[i, 0] / norm
+            x = quaternions[i, 1] / norm
+            y = quaternions[i, 2] / norm
+            z = quaternions[i, 3] / norm
+
+            m00 = 1 - 2 * (y * y + z * z)
+            m01 = 2 * (x * y - r * z)
+            m02 = 2 * (x * z + r * y)
+            m10 = 2 * (x * y + r * z)
+            m11 = 1 - 2 * (x * x + z * z)
+            m12 = 2 * (y * z - r * x)
+            m20 = 2 * (x * z - r * y)
+            m21 = 2 * (y * z + r * x)
+            m22 = 1 - 2 * (x * x + y * y)
+
+            n00 = rotation[0, 0] * m00 + rotation[0, 1] * m10 + rotation[0, 2] * m20
+            n01 = rotation[0, 0] * m01 + rotation[0, 1] * m11 + rotation[0, 2] * m21
+            n02 = rotation[0, 0] * m02 + rotation[0, 1] * m12 + rotation[0, 2] * m22
+            n10 = rotation[1, 0] * m00 + rotation[1, 1] * m10 + rotation[1, 2] * m20
+            n11 = rotation[1, 0] * m01 + rotation[1, 1] * m11 + rotation[1, 2] * m21
+            n12 = rotation[1, 0] * m02 + rotation[1, 1] * m12 + rotation[1, 2] * m22
+            n20 = rotation[2, 0] * m00 + rotation[2, 1] * m10 + rotation[2, 2] * m20
+            n21 = rotation[2, 0] * m01 + rotation[2, 1] * m11 + rotation[2, 2] * m21
+            n22 = rotation[2, 0] * m02 + rotation[2, 1] * m12 + rotation[2, 2] * m22
+
+            w = np.sqrt(1 + n00 + n11 + n22) / 2
+            out_quaternions[i, 0] = w
+            out_quaternions[i, 1] = (n21 - n12) / (4 * w)
+            out_quaternions[i, 2] = (n02 - n20) / (4 * w)
+            out_quaternions[i, 3] = (n10 - n01) / (4 * w)
+else:
+    _transform_gaussians_numba = None